@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""Stress concurrent features.yaml mutations and check backlog integrity.
+
+Launches K worker processes that issue random register/update/complete
+operations against one shared backlog, through the real CLI entrypoint,
+the in-process helper functions, or both. Afterwards the final file is
+checked for corrupt YAML, duplicate IDs, registrations that were
+acknowledged but are missing, and updates/completions that were overwritten
+by a concurrent writer. Exits 1 when any integrity check fails, so it can
+gate a locking or journaling change.
+
+    python benchmarks/features_yaml_stress.py --workers 8 --ops 40
+    python benchmarks/features_yaml_stress.py --path cli --python   # no uv: run features_yaml.py directly
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from queue import Empty
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+HELPER_SH = REPO_ROOT / "skills" / "_lib" / "features_yaml.sh"
+HELPER_PY = REPO_ROOT / "skills" / "_lib" / "features_yaml.py"
+FEATURES_FILE = "agent-work/features.yaml"
+ARCHIVE_FILE = "agent-work/history/stress.md"
+SEED_PER_WORKER = 4
+OPS = ["register", "update", "complete"]
+OP_WEIGHTS = [3, 5, 1]
+
+
+def load_helper():
+    spec = importlib.util.spec_from_file_location("features_yaml", HELPER_PY)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def seed_backlog(root: Path, workers: int) -> None:
+    (root / "agent-work" / "history").mkdir(parents=True)
+    (root / ARCHIVE_FILE).write_text("# stress archive\n")
+    seeded = [
+        {"id": f"w{worker}-{n + 1:03d}", "status": "pending", "title": f"Seed {n}", "priority": 2}
+        for worker in range(workers)
+        for n in range(SEED_PER_WORKER)
+    ]
+    helper = load_helper()
+    helper.save_features(str(root / FEATURES_FILE), seeded)
+
+
+def run_op(path: str, helper, command: list[str], op: str, args: tuple) -> dict | None:
+    """Run one mutation; return the helper result, or None if it failed."""
+    if path == "cli":
+        completed = subprocess.run(
+            [*command, *cli_args(op, args), "--output", "json"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            return None
+        try:
+            return json.loads(completed.stdout)
+        except json.JSONDecodeError:
+            return None
+
+    try:
+        if op == "register":
+            return helper.register_feature(FEATURES_FILE, args[0], dry_run=False)
+        if op == "update":
+            return helper.update_feature(FEATURES_FILE, args[0], args[1], dry_run=False)
+        return helper.complete_feature(FEATURES_FILE, args[0], ARCHIVE_FILE, dry_run=False)
+    except SystemExit:
+        return None
+    except Exception:
+        # Reading a half-written file can surface as a raw YAML error.
+        return None
+
+
+def cli_args(op: str, args: tuple) -> list[str]:
+    if op == "register":
+        return ["register", "--json", json.dumps(args[0])]
+    if op == "update":
+        return ["update", args[0], "--json", json.dumps(args[1])]
+    return ["complete", args[0], "--plan-file", ARCHIVE_FILE]
+
+
+def worker_main(worker: int, path: str, ops: int, seed: int, root: str, command: list[str], queue) -> None:
+    os.chdir(root)
+    helper = load_helper() if path == "inprocess" else None
+    if helper is not None:
+        # fail() prints to stderr; keep the report readable.
+        sys.stderr = open(os.devnull, "w")
+    rng = random.Random(seed + worker)
+    owned = [f"w{worker}-{n + 1:03d}" for n in range(SEED_PER_WORKER)]
+    records = []
+    for index in range(ops):
+        op = rng.choices(OPS, OP_WEIGHTS)[0] if owned else "register"
+        if op == "register":
+            args: tuple = (
+                {
+                    "epic": "stress",
+                    "title": f"W{worker} op{index}",
+                    "subtitle": "Concurrent register from stress harness",
+                    "description": "Registered by the stress harness.",
+                    "priority": rng.randint(0, 3),
+                },
+            )
+        elif op == "update":
+            target = rng.choice(owned)
+            args = (
+                target,
+                {
+                    "status": rng.choice(["pending", "in_progress"]),
+                    "plan_file": f"agent-work/plans/w{worker}-op{index}.md",
+                },
+            )
+        else:
+            target = owned.pop(rng.randrange(len(owned)))
+            args = (target,)
+
+        started = time.perf_counter()
+        result = run_op(path, helper, command, op, args)
+        elapsed = time.perf_counter() - started
+        record = {"worker": worker, "path": path, "op": op, "seconds": elapsed, "ok": result is not None}
+        if op == "register":
+            record["title"] = args[0]["title"]
+            record["id"] = result["feature"]["id"] if result else None
+        else:
+            record["target"] = args[0]
+            if op == "update":
+                record["patch"] = args[1]
+        records.append(record)
+    queue.put(records)
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def check_integrity(root: Path, records: list[dict]) -> dict:
+    helper = load_helper()
+    report: dict = {"corrupt": None, "duplicate_ids": [], "lost_registers": [], "lost_updates": []}
+    try:
+        text = (root / FEATURES_FILE).read_text()
+        data = helper.yaml.load(text, Loader=helper.SafeYAMLLoader) or []
+        if not isinstance(data, list) or not all(isinstance(item, dict) for item in data):
+            raise ValueError("top level is not a list of mappings")
+    except Exception as exc:
+        report["corrupt"] = str(exc).splitlines()[0]
+        return report
+
+    counts = Counter(item.get("id") for item in data)
+    report["duplicate_ids"] = sorted(str(feature_id) for feature_id, count in counts.items() if count > 1)
+    by_id = {item.get("id"): item for item in data}
+    titles = {item.get("title") for item in data}
+
+    acknowledged = Counter(record["id"] for record in records if record["op"] == "register" and record["ok"])
+    report["duplicate_ids"].extend(
+        sorted(f"{feature_id} (acknowledged {count}x)" for feature_id, count in acknowledged.items() if count > 1)
+    )
+    for record in records:
+        if record["op"] == "register" and record["ok"] and record["title"] not in titles:
+            report["lost_registers"].append(f"{record['id']} ({record['title']})")
+
+    # Each worker owns its seeded features, so the last acknowledged write per
+    # feature is the expected final state; anything else was clobbered.
+    expected: dict[str, dict] = {}
+    for record in records:
+        if record["op"] == "update" and record["ok"]:
+            expected[record["target"]] = record["patch"]
+        elif record["op"] == "complete" and record["ok"]:
+            expected[record["target"]] = {"status": "done", "plan_file": ARCHIVE_FILE}
+    for feature_id, fields in sorted(expected.items()):
+        actual = by_id.get(feature_id, {})
+        if any(actual.get(key) != value for key, value in fields.items()):
+            report["lost_updates"].append(feature_id)
+    return report
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=25, help="operations per worker")
+    parser.add_argument("--path", choices=("cli", "inprocess", "mixed"), default="mixed")
+    parser.add_argument("--python", action="store_true", help="run features_yaml.py with this interpreter instead of the uv entrypoint")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--keep", action="store_true", help="keep the temporary backlog for inspection")
+    args = parser.parse_args(argv)
+
+    command = [sys.executable, str(HELPER_PY)] if args.python else [str(HELPER_SH)]
+    if args.path != "inprocess" and not args.python and shutil.which("uv") is None:
+        print("uv not found; pass --python to drive features_yaml.py directly", file=sys.stderr)
+        return 2
+
+    root = Path(tempfile.mkdtemp(prefix="features-stress-"))
+    seed_backlog(root, args.workers)
+    paths = {
+        "cli": ["cli"] * args.workers,
+        "inprocess": ["inprocess"] * args.workers,
+        "mixed": ["cli" if worker % 2 == 0 else "inprocess" for worker in range(args.workers)],
+    }[args.path]
+
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=worker_main,
+            args=(worker, paths[worker], args.ops, args.seed, str(root), command, queue),
+        )
+        for worker in range(args.workers)
+    ]
+    started = time.perf_counter()
+    for process in processes:
+        process.start()
+    records: list[dict] = []
+    reported = 0
+    while reported < len(processes):
+        try:
+            records.extend(queue.get(timeout=1))
+            reported += 1
+        except Empty:
+            # A worker that died never reports; stop instead of waiting forever.
+            crashed = [(n, p.exitcode) for n, p in enumerate(processes) if p.exitcode not in (None, 0)]
+            if crashed:
+                for process in processes:
+                    process.terminate()
+                print("worker crashed: " + ", ".join(f"{n} (exit {code})" for n, code in crashed), file=sys.stderr)
+                if args.keep:
+                    print(f"backlog:   {root / FEATURES_FILE}", file=sys.stderr)
+                else:
+                    shutil.rmtree(root)
+                return 2
+    for process in processes:
+        process.join()
+    wall = time.perf_counter() - started
+
+    report = check_integrity(root, records)
+    if args.keep:
+        print(f"backlog:   {root / FEATURES_FILE}")
+    print(f"workers:   {args.workers} ({args.path})")
+    print(f"ops:       {len(records)} in {wall:.2f}s ({len(records) / wall:.1f} ops/s)")
+    for label in sorted({record["path"] for record in records}) + ["all"]:
+        scoped = [record for record in records if label == "all" or record["path"] == label]
+        latencies = [record["seconds"] * 1000 for record in scoped]
+        failed = sum(1 for record in scoped if not record["ok"])
+        print(
+            f"{label + ':':<10} p50 {percentile(latencies, 0.5):.1f}ms  "
+            f"p99 {percentile(latencies, 0.99):.1f}ms  failed {failed}/{len(scoped)}"
+        )
+    print(f"corrupt:   {report['corrupt'] or 'no'}")
+    print(f"dup ids:   {len(report['duplicate_ids'])} {' '.join(report['duplicate_ids'][:5])}".rstrip())
+    print(f"lost regs: {len(report['lost_registers'])} {' '.join(report['lost_registers'][:5])}".rstrip())
+    print(f"lost upds: {len(report['lost_updates'])} {' '.join(report['lost_updates'][:5])}".rstrip())
+
+    if not args.keep:
+        shutil.rmtree(root)
+    healthy = not (report["corrupt"] or report["duplicate_ids"] or report["lost_registers"] or report["lost_updates"])
+    return 0 if healthy else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Measure pv's resident memory for a synthetic portfolio.
+
+Builds N projects under a temporary root, scans them with pv, loads every
+project detail model with the detail cache's limits lifted so all stay
+resident, and reports the retained object graph size and process RSS growth.
+The scan cache is written inside the temporary root, never ~/.cache. Pass
+--trace for tracemalloc heap numbers (much slower).
+
+    python benchmarks/pv_memory.py                      # current bin/pv
+    git show HEAD~1:bin/pv > /tmp/pv-before
+    python benchmarks/pv_memory.py --pv /tmp/pv-before  # compare another revision
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import importlib.machinery
+import importlib.util
+import json
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Mapping
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+STATUSES = ["done"] * 6 + ["pending"] * 3 + ["in_progress", "abandoned"]
+EPICS = ["auth", "api", "ui", "infra", "docs", "billing", "search", "sync"]
+
+
+def load_pv(path: Path):
+    loader = importlib.machinery.SourceFileLoader("pv", str(path))
+    spec = importlib.util.spec_from_loader("pv", loader)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    loader.exec_module(module)
+    return module
+
+
+def rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def deep_size(root: object) -> int:
+    """Sum sys.getsizeof over every unique object reachable from root."""
+    seen: set[int] = set()
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, type):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, Mapping):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        if hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+        for cls in type(obj).__mro__:
+            for slot in getattr(cls, "__slots__", ()):
+                if hasattr(obj, slot):
+                    stack.append(getattr(obj, slot))
+    return total
+
+
+def build_portfolio(root: Path, projects: int, features: int, seed: int) -> None:
+    rng = random.Random(seed)
+    for p in range(projects):
+        backlog = root / f"project-{p:03d}" / "agent-work" / "features.yaml"
+        backlog.parent.mkdir(parents=True)
+        counters = {epic: 0 for epic in EPICS}
+        items = []
+        for _ in range(features):
+            epic = rng.choice(EPICS)
+            counters[epic] += 1
+            feature_id = f"{epic}-{counters[epic]:03d}"
+            status = rng.choice(STATUSES)
+            item = {
+                "id": feature_id,
+                "epic": epic,
+                "status": status,
+                "title": f"Feature {feature_id}",
+                "description": "Synthetic feature used for the pv memory benchmark.",
+                "priority": rng.randint(0, 3),
+                "created_at": f"2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+            }
+            if counters[epic] > 1 and rng.random() < 0.5:
+                item["depends_on"] = [f"{epic}-{rng.randint(1, counters[epic] - 1):03d}"]
+            if status == "done":
+                item["completed_at"] = f"2026-0{rng.randint(1, 9)}-2{rng.randint(0, 8)}"
+            items.append(item)
+        backlog.write_text(json.dumps(items))
+
+
+def main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pv", type=Path, default=REPO_ROOT / "bin" / "pv")
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--features", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--trace", action="store_true", help="also report tracemalloc heap")
+    args = parser.parse_args(argv)
+
+    pv = load_pv(args.pv)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "code"
+        os.environ["XDG_CACHE_HOME"] = str(Path(tmp) / "cache")
+        build_portfolio(root, args.projects, args.features, args.seed)
+
+        gc.collect()
+        rss_before = rss_bytes()
+        if args.trace:
+            tracemalloc.start()
+        started = time.perf_counter()
+
+        portfolio = pv.scan_projects(str(root))
+        details = getattr(portfolio, "details", None)  # the LRU, in revisions that have one
+        if details is not None:
+            details.max_features = details.max_entries = sys.maxsize
+        for project in portfolio.projects:
+            project.load_detail()
+
+        elapsed = time.perf_counter() - started
+        gc.collect()
+        if args.trace:
+            heap, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        rss_after = rss_bytes()
+
+    total = sum(project.total for project in portfolio.projects)
+    resident = sum(1 for project in portfolio.projects if project._detail is not None)
+    retained = deep_size(portfolio)
+    print(f"pv:        {args.pv}")
+    print(f"projects:  {len(portfolio.projects)}")
+    print(f"features:  {total}")
+    print(f"resident:  {resident}/{len(portfolio.projects)} detail models")
+    print(f"retained:  {retained / 1024 / 1024:.1f} MiB ({retained / max(total, 1):.0f} B/feature)")
+    if args.trace:
+        print(f"heap:      {heap / 1024 / 1024:.1f} MiB")
+    print(f"rss delta: {(rss_after - rss_before) / 1024 / 1024:.1f} MiB")
+    print(f"load time: {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -8,7 +8,9 @@
 
 import argparse
 import json
+import mmap
 import re
+import subprocess
 import sys
 from datetime import date
 from pathlib import Path
@@ -28,16 +30,24 @@ SafeYAMLLoader.yaml_implicit_resolvers = {
 
 
 ID_PATTERN = re.compile(r"^(?P<epic>.+)-(?P<num>\d+)$")
+MARKDOWN_HEADING_PATTERN = re.compile(r"^(?P<hashes>#{1,6})\s+(?P<title>.+?)\s*#*\s*$")
+BACKTICK_PATH_PATTERN = re.compile(r"`([^`\s]+)`")
+BOLD_LABEL_PATTERN = re.compile(r"^\*\*(?P<title>[^*]+)\*\*")
+LINE_RANGE_SUFFIX = re.compile(r":\d+(?:-\d+)?$")
 CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x1f\x7f]")
 INVALID_ID_CHARACTERS = {"?", "#", "%"}
 STATUSES = {"pending", "in_progress", "done", "abandoned", "superseded"}
 MUTABLE_STATUSES = STATUSES - {"done"}
 DEFAULT_FEATURES_FILE = "agent-work/features.yaml"
 PLAN_DIR = "agent-work/plans"
+FILE_LOCKS_FILE = f"{PLAN_DIR}/.file-locks.json"
+HISTORY_CACHE_FILE = "features-history.json"
+HISTORY_CACHE_VERSION = 2
 MAX_ID_CHARS = 80
 MAX_TITLE_CHARS = 32
 MAX_SUBTITLE_CHARS = 64
 MAX_DESCRIPTION_CHARS = 240
+INTERNED_FIELDS = ("id", "status", "epic", "created_at", "completed_at", "discovered_from")
 REGISTER_FIELDS = {"epic", "status", "title", "subtitle", "description", "priority", "created_at", "depends_on", "plan_file", "discovered_from", "references"}
 
 
@@ -87,6 +97,17 @@ COMMAND_SPECS = {
         ],
         "output_modes": ["text", "json", "id"],
     },
+    "schedule": {
+        "summary": "Propose a batch of ready features that are independent and do not overlap on plan files.",
+        "arguments": [
+            {"name": "--workers", "required": True, "type": "integer"},
+            {"name": "--epic", "required": False, "type": "string"},
+            {"name": "--locks", "required": False, "type": "path", "default": FILE_LOCKS_FILE},
+            {"name": "--file", "required": False, "type": "path", "default": DEFAULT_FEATURES_FILE},
+            {"name": "--output", "required": False, "type": "text|json|id", "default": "text"},
+        ],
+        "output_modes": ["text", "json", "id"],
+    },
     "get": {
         "summary": "Show one tracked feature by ID, including persisted fields.",
         "arguments": [
@@ -128,6 +149,15 @@ COMMAND_SPECS = {
         ],
         "output_modes": ["text", "json"],
     },
+    "history": {
+        "summary": "List per-feature status transitions from the backlog's git history.",
+        "arguments": [
+            {"name": "--feature", "required": False, "type": "tracked-id"},
+            {"name": "--file", "required": False, "type": "path", "default": DEFAULT_FEATURES_FILE},
+            {"name": "--output", "required": False, "type": "text|json|jsonl", "default": "text"},
+        ],
+        "output_modes": ["text", "json", "jsonl"],
+    },
     "describe": {
         "summary": "Describe the helper contract or a specific command.",
         "arguments": [
@@ -158,7 +188,62 @@ def load_features(path_str: str) -> list[dict]:
         fail(f"features file must contain a top-level sequence: {path_str}")
     if not all(isinstance(item, dict) for item in data):
         fail(f"features file must contain mapping entries: {path_str}")
-    return data
+    return [intern_feature(item) for item in data]
+
+
+def intern_feature(feature: dict) -> dict:
+    interned = {sys.intern(key) if isinstance(key, str) else key: value for key, value in feature.items()}
+    for key in INTERNED_FIELDS:
+        value = interned.get(key)
+        if isinstance(value, str):
+            interned[key] = sys.intern(value)
+    depends_on = interned.get("depends_on")
+    if isinstance(depends_on, list):
+        interned["depends_on"] = [sys.intern(dep) if isinstance(dep, str) else dep for dep in depends_on]
+    return interned
+
+
+def load_feature_entry(path_str: str, feature_id: str) -> dict | None:
+    """Parse only the top-level entry for feature_id in a save_features-shaped file.
+
+    Entries start with `- id: <id>` at column zero, so their spans can be found with
+    a byte scan over a memory map. Returns None whenever the file is not in that
+    canonical form, the ID appears more than once, or the span does not parse to
+    exactly that entry; callers then fall back to a full load, which decides.
+    """
+    path = Path(path_str)
+    if not path.is_file() or path.stat().st_size == 0:
+        return None
+
+    needle = f"- id: {feature_id}\n".encode()
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        if view[:2] != b"- ":
+            return None
+        if view[: len(needle)] == needle:
+            start = 0
+        else:
+            start = view.find(b"\n" + needle)
+            if start < 0:
+                return None
+            start += 1
+        # Another entry for this ID, even a quoted one, leaves the choice to the full load.
+        if view.find(b"\n" + needle, start) >= 0:
+            return None
+        if any(view.find(f"- id: {quote}{feature_id}{quote}\n".encode()) >= 0 for quote in "'\""):
+            return None
+        end = view.find(b"\n- ", start + len(needle) - 1)
+        span = view[start : len(view) if end < 0 else end + 1]
+
+    try:
+        entries = yaml.load(span, Loader=SafeYAMLLoader)
+    except yaml.YAMLError:
+        return None
+    if not isinstance(entries, list) or len(entries) != 1:
+        return None
+    entry = entries[0]
+    if not isinstance(entry, dict) or entry.get("id") != feature_id:
+        return None
+    return intern_feature(entry)
 
 
 def save_features(path_str: str, data: list[dict]) -> None:
@@ -489,8 +574,10 @@ def complete_feature(
 
 def get_feature(path_str: str, feature_id: str) -> dict[str, Any]:
     feature_id = ensure_tracked_id(feature_id)
-    data = load_features(path_str)
-    feature = require_feature(data, feature_id)
+    feature = load_feature_entry(path_str, feature_id)
+    if feature is None:
+        data = load_features(path_str)
+        feature = require_feature(data, feature_id)
     return {"command": "get", "feature": dict(feature)}
 
 
@@ -583,6 +670,351 @@ def select_next_feature(path_str: str, epic_filter: str | None) -> dict[str, Any
     }
 
 
+def priority_value(feature: dict) -> int:
+    return sort_key(feature)[0]
+
+
+def plan_context_files(plan_path: Path) -> list[str]:
+    """Return the Core paths listed under a plan's Context Files heading.
+
+    Subsections are headings or bold labels (`### Core (will modify)`,
+    `**Core (modify):**`); any whose title starts with "core" reserves its
+    paths, while Reference/Config ones are read-only context. Plans without
+    subsections contribute every bulleted path. `file:12-30` line ranges
+    reserve the whole file.
+    """
+    try:
+        text = plan_path.read_text()
+    except (OSError, UnicodeDecodeError):
+        return []
+
+    section_level = 0
+    subsection: str | None = None
+    core: list[str] = []
+    unsectioned: list[str] = []
+    for line in text.splitlines():
+        match = MARKDOWN_HEADING_PATTERN.match(line)
+        if match:
+            level = len(match.group("hashes"))
+            title = match.group("title").strip().lower()
+            if title == "context files":
+                section_level = level
+                subsection = None
+            elif section_level and level <= section_level:
+                break
+            elif section_level:
+                subsection = title
+            continue
+        if not section_level:
+            continue
+        label = BOLD_LABEL_PATTERN.match(line.strip())
+        if label:
+            subsection = label.group("title").strip(" :").lower()
+            continue
+        if not line.lstrip().startswith(("- ", "* ")):
+            continue
+        path_match = BACKTICK_PATH_PATTERN.search(line)
+        if not path_match:
+            continue
+        file_path = LINE_RANGE_SUFFIX.sub("", path_match.group(1)).removeprefix("./")
+        if subsection is None:
+            unsectioned.append(file_path)
+        elif subsection.startswith("core"):
+            core.append(file_path)
+    return list(dict.fromkeys(core or unsectioned))
+
+
+def load_file_locks(lock_path: Path) -> dict[str, str]:
+    try:
+        payload = json.loads(lock_path.read_text())
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as exc:
+        fail(f"failed to read {lock_path}: {exc}")
+    if not isinstance(payload, dict):
+        fail(f"{lock_path} must contain a JSON object")
+    return {
+        str(path): str(entry.get("by"))
+        for path, entry in payload.items()
+        if isinstance(entry, dict) and entry.get("by")
+    }
+
+
+def transitive_dependent_counts(active: list[dict]) -> dict[str, int]:
+    """Count open features that transitively wait on each open feature.
+
+    Descendant sets are int bitsets filled in DFS post-order, so shared
+    subgraphs are merged once instead of re-walked per candidate.
+    """
+    index = {feature["id"]: position for position, feature in enumerate(active)}
+    dependents: list[list[int]] = [[] for _ in active]
+    for position, feature in enumerate(active):
+        for dep in feature.get("depends_on", []) or []:
+            parent = index.get(dep)
+            if parent is not None and parent != position:
+                dependents[parent].append(position)
+
+    reach = [0] * len(active)
+    state = [0] * len(active)  # 0 = unvisited, 1 = on stack, 2 = finished
+    for root in range(len(active)):
+        if state[root]:
+            continue
+        stack = [(root, 0)]
+        state[root] = 1
+        while stack:
+            node, cursor = stack[-1]
+            children = dependents[node]
+            if cursor < len(children):
+                stack[-1] = (node, cursor + 1)
+                child = children[cursor]
+                if not state[child]:
+                    state[child] = 1
+                    stack.append((child, 0))
+                continue
+            bits = 0
+            for child in children:
+                bits |= (1 << child) | reach[child]
+            reach[node] = bits & ~(1 << node)
+            state[node] = 2
+            stack.pop()
+    return {feature["id"]: reach[position].bit_count() for position, feature in enumerate(active)}
+
+
+def backlog_root(path: Path) -> Path:
+    """The project root a backlog belongs to: the parent of its agent-work/ directory."""
+    path = path.resolve()
+    return path.parent.parent if path.parent.name == "agent-work" else path.parent
+
+
+def schedule_features(
+    path_str: str,
+    workers: int,
+    epic_filter: str | None,
+    lock_path_str: str,
+) -> dict[str, Any]:
+    if workers < 1:
+        fail("--workers must be at least 1")
+    if epic_filter:
+        ensure_epic(epic_filter)
+
+    path = Path(path_str)
+    result: dict[str, Any] = {
+        "command": "schedule",
+        "workers": workers,
+        "epic": epic_filter,
+        "batch": [],
+        "skipped": [],
+        "ready_count": 0,
+        "missing_file": not path.is_file(),
+    }
+    if result["missing_file"]:
+        return result
+
+    data = load_features(path_str)
+    resolved = {feature.get("id") for feature in data if feature.get("status") == "done"}
+    active = [
+        feature
+        for feature in data
+        if feature.get("status") in {"pending", "in_progress"} and isinstance(feature.get("id"), str)
+    ]
+    unblocks = transitive_dependent_counts(active)
+    ready = [
+        feature
+        for feature in filter_by_epic(active, epic_filter)
+        if feature.get("status") == "pending"
+        and all(dep in resolved for dep in feature.get("depends_on", []) or [])
+    ]
+    ready.sort(key=lambda feature: (priority_value(feature), -unblocks[feature["id"]], *sort_key(feature)[1:]))
+    result["ready_count"] = len(ready)
+
+    # Plan and lock paths are repo-relative, whatever directory the helper runs from.
+    root = backlog_root(path)
+
+    def plan_files(feature: dict) -> list[str]:
+        plan_file = feature.get("plan_file") or f"{PLAN_DIR}/{feature['id']}.md"
+        return plan_context_files(root / str(plan_file))
+
+    # Files held by reservations or by tickets already in progress are off limits.
+    claimed = dict(load_file_locks(root / lock_path_str))
+    for feature in active:
+        if feature.get("status") == "in_progress":
+            for file_path in plan_files(feature):
+                claimed.setdefault(file_path, feature["id"])
+
+    selected: set[str] = set()
+    for feature in ready:
+        if len(result["batch"]) >= workers:
+            break
+        feature_id = feature["id"]
+        # Ready means every dependency is done, so two ready tickets can never
+        # wait on each other; this only guards against malformed self-cycles.
+        waiting = [dep for dep in feature.get("depends_on", []) or [] if dep in selected]
+        files = plan_files(feature)
+        overlaps = {file_path: claimed[file_path] for file_path in files if claimed.get(file_path, feature_id) != feature_id}
+        if waiting or overlaps:
+            result["skipped"].append(
+                {"id": feature_id, "depends_on_selected": waiting, "file_conflicts": overlaps}
+            )
+            continue
+        for file_path in files:
+            claimed[file_path] = feature_id
+        selected.add(feature_id)
+        details = feature_details(feature)
+        details["unblocks"] = unblocks[feature_id]
+        details["files"] = files
+        result["batch"].append(details)
+    return result
+
+
+def run_git(args: list[str], cwd: Path, *, input_bytes: bytes | None = None) -> bytes:
+    try:
+        completed = subprocess.run(["git", *args], cwd=cwd, input=input_bytes, capture_output=True, check=False)
+    except FileNotFoundError:
+        fail("history requires git on PATH")
+    if completed.returncode != 0:
+        fail(f"git {args[0]} failed: {completed.stderr.decode(errors='replace').strip()}")
+    return completed.stdout
+
+
+def snapshot_statuses(content: bytes) -> dict[str, str]:
+    """Map feature ID to status for one committed revision of the backlog.
+
+    Helper-written files are read line by line; anything else (JSON, quoted
+    scalars, flow style) goes through the safe loader.
+    """
+    text = content.decode("utf-8", errors="replace")
+    if text.startswith("- id: "):
+        statuses: dict[str, str] = {}
+        current = None
+        for line in text.splitlines():
+            if line.startswith("- "):
+                if not line.startswith("- id: "):
+                    break
+                current = line[6:]
+                statuses.setdefault(current, "pending")
+            elif current is not None and line.startswith("  status: "):
+                statuses[current] = line[10:]
+        else:
+            if not any(value[:1] in ("'", '"') for value in (*statuses, *statuses.values())):
+                return statuses
+
+    try:
+        data = yaml.load(text, Loader=SafeYAMLLoader)
+    except yaml.YAMLError:
+        return {}
+    if not isinstance(data, list):
+        return {}
+    return {
+        str(item["id"]): str(item.get("status", "pending"))
+        for item in data
+        if isinstance(item, dict) and "id" in item
+    }
+
+
+def history_cache_path(git_dir: Path) -> Path:
+    return git_dir / HISTORY_CACHE_FILE
+
+
+def load_history_cache(git_dir: Path, rel_path: str) -> dict[str, Any]:
+    try:
+        cache = json.loads(history_cache_path(git_dir).read_text())
+    except (OSError, ValueError):
+        cache = {}
+    if not isinstance(cache, dict) or cache.get("version") != HISTORY_CACHE_VERSION:
+        cache = {"version": HISTORY_CACHE_VERSION, "files": {}}
+    entry = cache["files"].get(rel_path)
+    if not isinstance(entry, dict):
+        entry = {"head": None, "statuses": {}, "transitions": []}
+    return {"cache": cache, "entry": entry}
+
+
+def collect_history(path_str: str) -> dict[str, Any]:
+    """Walk commits touching the backlog and cache transitions by commit hash.
+
+    The cache lives in the repository's common git dir, keyed by the backlog's
+    repo-relative path, and records the last processed commit plus the status
+    snapshot at that commit so later runs only read newer commits.
+    """
+    path = Path(path_str).resolve()
+    cwd = path.parent if path.parent.is_dir() else Path.cwd()
+    lines = run_git(["rev-parse", "--show-toplevel", "--git-common-dir"], cwd).decode().splitlines()
+    toplevel = Path(lines[0])
+    git_dir = (cwd / lines[1]).resolve()
+    try:
+        rel_path = path.relative_to(toplevel).as_posix()
+    except ValueError:
+        fail(f"features file is outside the git repository: {path_str}")
+
+    loaded = load_history_cache(git_dir, rel_path)
+    cache, entry = loaded["cache"], loaded["entry"]
+    head = entry.get("head")
+    if head:
+        ancestor = subprocess.run(
+            ["git", "merge-base", "--is-ancestor", head, "HEAD"], cwd=toplevel, capture_output=True, check=False
+        )
+        if ancestor.returncode != 0:
+            entry = {"head": None, "statuses": {}, "transitions": []}
+            head = None
+
+    revision_range = [f"{head}..HEAD"] if head else ["HEAD"]
+    has_head = subprocess.run(["git", "rev-parse", "--verify", "-q", "HEAD"], cwd=toplevel, capture_output=True, check=False)
+    log = b""
+    if has_head.returncode == 0:
+        # First-parent only: a merged branch's commits would interleave its transitions with ours.
+        log = run_git(
+            ["log", "--first-parent", "--reverse", "--format=%H %cI", *revision_range, "--", rel_path], toplevel
+        )
+    commits = [line.split(" ", 1) for line in log.decode().splitlines() if line]
+
+    if commits:
+        request = "".join(f"{sha}:{rel_path}\n" for sha, _ in commits).encode()
+        output = run_git(["cat-file", "--batch"], toplevel, input_bytes=request)
+        statuses: dict[str, str] = entry["statuses"]
+        offset = 0
+        for sha, timestamp in commits:
+            header_end = output.index(b"\n", offset)
+            header = output[offset:header_end].split()
+            offset = header_end + 1
+            if header[-1] == b"missing":
+                current: dict[str, str] = {}
+            else:
+                size = int(header[2])
+                current = snapshot_statuses(output[offset : offset + size])
+                offset += size + 1
+            for feature_id in list(statuses) + [key for key in current if key not in statuses]:
+                before, after = statuses.get(feature_id), current.get(feature_id)
+                if before != after:
+                    entry["transitions"].append(
+                        {"id": feature_id, "from": before, "to": after, "commit": sha, "timestamp": timestamp}
+                    )
+            statuses = current
+        entry["statuses"] = statuses
+        entry["head"] = commits[-1][0]
+        cache["files"][rel_path] = entry
+        cache_path = history_cache_path(git_dir)
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cache))
+        tmp_path.replace(cache_path)
+
+    return {"file": rel_path, "processed_commits": len(commits), "transitions": entry["transitions"]}
+
+
+def feature_history(path_str: str, feature_filter: str | None) -> dict[str, Any]:
+    if feature_filter:
+        ensure_tracked_id(feature_filter)
+    history = collect_history(path_str)
+    transitions = history["transitions"]
+    if feature_filter:
+        transitions = [item for item in transitions if item["id"] == feature_filter]
+    return {
+        "command": "history",
+        "file": history["file"],
+        "feature": feature_filter,
+        "processed_commits": history["processed_commits"],
+        "transitions": transitions,
+    }
+
+
 def describe_command(command_name: str | None) -> dict[str, Any]:
     if command_name:
         if command_name not in COMMAND_SPECS:
@@ -694,6 +1126,35 @@ def emit_text(result: dict[str, Any]) -> None:
         print(f"Suggested plan file: {result['suggested_plan_file']}")
         return
 
+    if command == "schedule":
+        if result.get("missing_file"):
+            print(f"No {DEFAULT_FEATURES_FILE} found. Initialize the project with /project-init or create the file with [].")
+            return
+        print(f"BATCH ({len(result['batch'])} of {result['workers']} workers, {result['ready_count']} ready)")
+        if not result["batch"]:
+            print("none")
+        for index, feature in enumerate(result["batch"], start=1):
+            print(
+                f"{index}. {feature['id']} (priority {feature['priority'] or '-'}, "
+                f"unblocks {feature['unblocks']})"
+            )
+            print(f"   files: {', '.join(feature['files']) or 'none listed'}")
+        if result["skipped"]:
+            print()
+            print("SKIPPED")
+            for item in result["skipped"]:
+                reasons = [f"{path} held by {holder}" for path, holder in item["file_conflicts"].items()]
+                reasons.extend(f"depends on {dep}" for dep in item["depends_on_selected"])
+                print(f"- {item['id']} -> {'; '.join(reasons)}")
+        return
+
+    if command == "history":
+        if not result["transitions"]:
+            print(f"No status transitions recorded for {result['file']}")
+        for item in result["transitions"]:
+            print(f"{item['timestamp']} {item['commit'][:10]} {item['id']}: {item['from'] or '-'} -> {item['to'] or '-'}")
+        return
+
     if command == "normalize":
         print(f"Normalized {result['normalized']} feature records" if result["changed"] else "No normalization changes")
         return
@@ -732,9 +1193,22 @@ def emit_text(result: dict[str, Any]) -> None:
     fail(f"no text emitter for command: {command}")
 
 
+def emit_jsonl(result: dict[str, Any]) -> None:
+    if result["command"] != "history":
+        fail("--output jsonl is only supported for the history command")
+    for item in result["transitions"]:
+        print(json.dumps(item, sort_keys=False))
+
+
 def emit_id(result: dict[str, Any]) -> None:
+    if result["command"] == "schedule":
+        if result.get("missing_file") or not result["batch"]:
+            raise SystemExit(1)
+        for feature in result["batch"]:
+            print(feature["id"])
+        return
     if result["command"] != "next":
-        fail("--output id is only supported for the next command")
+        fail("--output id is only supported for the next and schedule commands")
     if result.get("missing_file"):
         raise SystemExit(1)
     recommended = result["recommended"]
@@ -752,7 +1226,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--output",
         dest="global_output",
         default=argparse.SUPPRESS,
-        choices=("text", "json", "id"),
+        choices=("text", "json", "id", "jsonl"),
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -787,6 +1261,27 @@ def build_parser() -> argparse.ArgumentParser:
     )
     next_parser.set_defaults(handler=handle_next)
 
+    schedule = subparsers.add_parser(
+        "schedule",
+        parents=[file_parent],
+        description="Propose up to N ready features for parallel workers. Candidates are ranked by priority, "
+        "then by how many open features transitively wait on them; a candidate is skipped when a Core path "
+        "from its plan's Context Files is reserved in the lock file, held by in-progress work, or already "
+        "claimed by an earlier pick.",
+        epilog="""Examples:
+  features_yaml.sh schedule --workers 3
+  features_yaml.sh schedule --workers 4 --epic tui --output id
+""",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    schedule.add_argument("--workers", type=int, required=True)
+    schedule.add_argument("--epic")
+    schedule.add_argument("--locks", default=FILE_LOCKS_FILE)
+    schedule.add_argument(
+        "--output", default=argparse.SUPPRESS, choices=("text", "json", "id")
+    )
+    schedule.set_defaults(handler=handle_schedule)
+
     get = subparsers.add_parser(
         "get",
         parents=[file_parent, read_output_parent],
@@ -854,6 +1349,21 @@ def build_parser() -> argparse.ArgumentParser:
     complete.add_argument("--plan-file", required=True)
     complete.set_defaults(handler=handle_complete)
 
+    history = subparsers.add_parser(
+        "history",
+        parents=[file_parent],
+        description="List per-feature status transitions from the backlog's git history. "
+        "Processed commits are cached in the repository's git dir; later runs only read new commits.",
+        epilog="""Examples:
+  features_yaml.sh history
+  features_yaml.sh history --feature tui-002 --output jsonl
+""",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    history.add_argument("--feature")
+    history.add_argument("--output", default=argparse.SUPPRESS, choices=("text", "json", "jsonl"))
+    history.set_defaults(handler=handle_history)
+
     describe = subparsers.add_parser(
         "describe",
         description="Describe the helper contract or a specific helper command.",
@@ -887,6 +1397,10 @@ def handle_next(args: argparse.Namespace) -> dict[str, Any]:
     return select_next_feature(args.file, args.epic)
 
 
+def handle_schedule(args: argparse.Namespace) -> dict[str, Any]:
+    return schedule_features(args.file, args.workers, args.epic, args.locks)
+
+
 def handle_get(args: argparse.Namespace) -> dict[str, Any]:
     return get_feature(args.file, args.feature_id)
 
@@ -910,6 +1424,10 @@ def handle_complete(args: argparse.Namespace) -> dict[str, Any]:
     return complete_feature(args.file, args.feature_id, args.plan_file, dry_run=args.dry_run)
 
 
+def handle_history(args: argparse.Namespace) -> dict[str, Any]:
+    return feature_history(args.file, args.feature)
+
+
 def handle_describe(args: argparse.Namespace) -> dict[str, Any]:
     return {"command": "describe", **describe_command(args.describe_command)}
 
@@ -925,6 +1443,8 @@ def main(argv: list[str]) -> int:
         emit_json(result)
     elif args.output == "id":
         emit_id(result)
+    elif args.output == "jsonl":
+        emit_jsonl(result)
     else:
         emit_text(result)
     return 0
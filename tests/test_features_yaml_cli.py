@@ -27,15 +27,20 @@ class FeaturesYamlCliTest(unittest.TestCase):
         self.features_file.parent.mkdir(parents=True, exist_ok=True)
         self.features_file.write_text(json.dumps(payload, indent=2))
 
+    def write_canonical_features(self, payload: list[dict]) -> None:
+        self.features_file.parent.mkdir(parents=True, exist_ok=True)
+        self.features_file.write_text(yaml.dump(payload, default_flow_style=False, sort_keys=False))
+
     def run_helper(
         self,
         *args: str,
         expect_ok: bool = True,
         input_text: str | None = None,
+        cwd: Path | None = None,
     ) -> subprocess.CompletedProcess[str]:
         result = subprocess.run(
             [str(HELPER), *args],
-            cwd=self.workdir,
+            cwd=cwd or self.workdir,
             text=True,
             input=input_text,
             capture_output=True,
@@ -162,12 +167,167 @@ class FeaturesYamlCliTest(unittest.TestCase):
         self.assertIn("plan_file: agent-work/plans/skill-006.md", result.stdout)
         self.assertIn("description: Agent can inspect persisted fields", result.stdout)
 
+    def test_get_feature_reads_single_entry_from_canonical_file(self) -> None:
+        features = [
+            {"id": "skill-001", "status": "done", "depends_on": []},
+            {"id": "skill-002", "status": "pending", "depends_on": ["skill-001"], "description": "Middle entry " * 12},
+            {"id": "skill-003", "status": "pending"},
+        ]
+        self.write_canonical_features(features)
+
+        for feature in features:
+            result = self.run_helper("--file", str(self.features_file), "get", feature["id"], "--output", "json")
+            self.assertEqual(json.loads(result.stdout)["feature"], feature)
+
+        missing = self.run_helper("--file", str(self.features_file), "get", "skill-004", expect_ok=False)
+        self.assertIn("feature not found in features.yaml: skill-004", missing.stderr)
+
+    def test_get_feature_falls_back_when_entry_uses_shared_anchor(self) -> None:
+        shared = ["skill-001"]
+        self.write_canonical_features([
+            {"id": "skill-002", "status": "pending", "depends_on": shared},
+            {"id": "skill-003", "status": "pending", "depends_on": shared},
+        ])
+        self.assertIn("*id", self.features_file.read_text())
+
+        result = self.run_helper("--file", str(self.features_file), "get", "skill-003", "--output", "json")
+
+        self.assertEqual(json.loads(result.stdout)["feature"]["depends_on"], ["skill-001"])
+
+    def test_get_feature_with_duplicate_id_matches_the_full_load(self) -> None:
+        features = [
+            {"id": "skill-001", "status": "done"},
+            {"id": "skill-002", "status": "pending"},
+            {"id": "skill-001", "status": "pending", "title": "Re-added"},
+        ]
+        self.write_features(features)  # JSON: always the full load
+        full = self.run_helper("--file", str(self.features_file), "get", "skill-001", "--output", "json")
+        self.write_canonical_features(features)
+
+        result = self.run_helper("--file", str(self.features_file), "get", "skill-001", "--output", "json")
+
+        self.assertEqual(json.loads(result.stdout), json.loads(full.stdout))
+
+        quoted_first = self.features_file.read_text().replace("- id: skill-001\n", "- id: 'skill-001'\n", 1)
+        self.features_file.write_text(quoted_first)
+        result = self.run_helper("--file", str(self.features_file), "get", "skill-001", "--output", "json")
+        self.assertEqual(json.loads(result.stdout), json.loads(full.stdout))
+
+    def test_history_reports_transitions_and_reuses_commit_cache(self) -> None:
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], cwd=self.workdir, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("config", "user.email", "dev@example.com")
+        git("config", "user.name", "Dev")
+        self.write_canonical_features([{"id": "skill-001", "status": "pending"}])
+        git("add", "-A")
+        git("commit", "-qm", "register")
+        self.write_canonical_features([{"id": "skill-001", "status": "in_progress"}])
+        git("commit", "-qam", "start")
+
+        first = self.run_helper("history", "--output", "json")
+        payload = json.loads(first.stdout)
+        self.assertEqual(payload["processed_commits"], 2)
+        self.assertEqual(
+            [(item["id"], item["from"], item["to"]) for item in payload["transitions"]],
+            [("skill-001", None, "pending"), ("skill-001", "pending", "in_progress")],
+        )
+
+        self.write_canonical_features([{"id": "skill-001", "status": "done"}])
+        git("commit", "-qam", "finish")
+        lines = self.run_helper("history", "--output", "jsonl").stdout.splitlines()
+        self.assertEqual(json.loads(lines[-1])["to"], "done")
+        self.assertEqual(len(lines), 3)
+
+        rerun = json.loads(self.run_helper("history", "--output", "json").stdout)
+        self.assertEqual(rerun["processed_commits"], 0)
+        self.assertEqual(len(rerun["transitions"]), 3)
+
     def test_describe_feature_id_points_to_get(self) -> None:
         result = self.run_helper("describe", "skill-006", expect_ok=False)
 
         self.assertIn("describe expects one of", result.stderr)
         self.assertIn("get skill-006 --output json", result.stderr)
 
+    def test_schedule_skips_file_overlaps_and_ranks_by_unblock_impact(self) -> None:
+        self.write_features(
+            [
+                {"id": "skill-001", "status": "pending", "priority": 1},
+                {"id": "skill-002", "status": "pending", "priority": 1},
+                {"id": "skill-003", "status": "pending", "priority": 2, "depends_on": ["skill-002"]},
+                {"id": "skill-004", "status": "pending", "priority": 2},
+                {"id": "skill-005", "status": "pending", "priority": 2},
+            ]
+        )
+        plans = self.workdir / "agent-work" / "plans"
+        plans.mkdir(parents=True)
+        (plans / "skill-002.md").write_text(
+            "## Context Files\n\n### Core\n\n- `src/app.py`\n\n### Reference\n\n- `README.md`\n"
+        )
+        (plans / "skill-001.md").write_text("## Context Files\n\n- `src/app.py`\n")
+        (plans / "skill-004.md").write_text("## Context Files\n\n### Core\n\n- `src/locked.py`\n")
+        (plans / ".file-locks.json").write_text(json.dumps({"src/locked.py": {"by": "other-001", "at": "now"}}))
+
+        result = self.run_helper("schedule", "--workers", "3", "--output", "json")
+
+        payload = json.loads(result.stdout)
+        self.assertEqual([item["id"] for item in payload["batch"]], ["skill-002", "skill-005"])
+        self.assertEqual(payload["batch"][0]["unblocks"], 1)
+        self.assertEqual(payload["ready_count"], 4)
+        self.assertEqual(
+            payload["skipped"],
+            [
+                {"id": "skill-001", "depends_on_selected": [], "file_conflicts": {"src/app.py": "skill-002"}},
+                {"id": "skill-004", "depends_on_selected": [], "file_conflicts": {"src/locked.py": "other-001"}},
+            ],
+        )
+
+    def test_schedule_reads_real_plan_heading_variants_from_any_directory(self) -> None:
+        self.write_features(
+            [
+                {"id": "pv-006", "status": "in_progress", "priority": 1},
+                {"id": "pv-007", "status": "pending", "priority": 1},
+                {"id": "pv-008", "status": "pending", "priority": 2},
+                {"id": "cmd-005", "status": "pending", "priority": 2},
+            ]
+        )
+        plans = self.workdir / "agent-work" / "plans"
+        plans.mkdir(parents=True)
+        (plans / "pv-006.md").write_text(
+            "## Context Files\n\n### Core (will modify)\n\n- `bin/pv` - TUI\n\n"
+            "### Reference (patterns to follow)\n\n- `README.md`\n"
+        )
+        (plans / "pv-007.md").write_text(
+            "## Context Files\n\n**Core (modify):**\n- `bin/pv:135-154` - input handlers\n\n"
+            "**Reference:**\n- `skills/prime/SKILL.md`\n"
+        )
+        (plans / "pv-008.md").write_text(
+            "## Context Files\n\n**Core** (files being modified):\n- `docs/pv.md`\n\n"
+            "**Reference (patterns):**\n- `bin/pv` - read only\n"
+        )
+        (plans / "cmd-005.md").write_text(
+            "## Context Files\n\n### Core (files to modify)\n\n- `skills/prime/SKILL.md`\n"
+        )
+        (plans / ".file-locks.json").write_text(json.dumps({"docs/pv.md": {"by": "other-001", "at": "now"}}))
+        subdir = self.workdir / "src"
+        subdir.mkdir()
+
+        result = self.run_helper(
+            "--file", str(self.features_file), "schedule", "--workers", "3", "--output", "json", cwd=subdir
+        )
+
+        payload = json.loads(result.stdout)
+        self.assertEqual([item["id"] for item in payload["batch"]], ["cmd-005"])
+        self.assertEqual(payload["batch"][0]["files"], ["skills/prime/SKILL.md"])
+        self.assertEqual(
+            payload["skipped"],
+            [
+                {"id": "pv-007", "depends_on_selected": [], "file_conflicts": {"bin/pv": "pv-006"}},
+                {"id": "pv-008", "depends_on_selected": [], "file_conflicts": {"docs/pv.md": "other-001"}},
+            ],
+        )
+
     def test_next_reports_blocked_items(self) -> None:
         self.write_features(
             [
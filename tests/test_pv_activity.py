@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+import importlib.machinery
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+pv_path = Path(__file__).parent.parent / "bin" / "pv"
+loader = importlib.machinery.SourceFileLoader("pv", str(pv_path))
+spec = importlib.util.spec_from_loader("pv", loader)
+pv = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = pv
+loader.exec_module(pv)
+
+
+def write_project(root: Path, features: list[dict]) -> Path:
+    features_path = root / "agent-work" / "features.yaml"
+    features_path.parent.mkdir(parents=True, exist_ok=True)
+    features_path.write_text(json.dumps(features))
+    return features_path
+
+
+def test_activity_prefers_git_history_cycle_times(tmp_path: Path):
+    write_project(tmp_path, [
+        {"id": "auth-001", "epic": "auth", "status": "done", "created_at": "2026-01-01", "completed_at": "2026-01-11"},
+        {"id": "auth-002", "epic": "auth", "status": "done", "created_at": "2026-01-01", "completed_at": "2026-01-05"},
+    ])
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / pv.HISTORY_CACHE_FILE).write_text(json.dumps({
+        "version": 1,
+        "files": {"agent-work/features.yaml": {"transitions": [
+            {"id": "auth-001", "from": "pending", "to": "in_progress", "timestamp": "2026-01-10T00:00:00+00:00"},
+            {"id": "auth-001", "from": "in_progress", "to": "done", "timestamp": "2026-01-11T12:00:00+00:00"},
+        ]}},
+    }))
+    portfolio = pv.Portfolio(projects=[pv.ProjectSummary.from_path(str(tmp_path / "agent-work" / "features.yaml"))])
+
+    data = pv.ActivityData.from_portfolio(portfolio)
+
+    # auth-001 uses the 1.5-day git cycle; auth-002 falls back to 4 calendar days.
+    assert data.avg_cycle_time == (1.5 + 4) / 2
+    assert data.total_done == 2
+
+
+def test_activity_merges_scan_aggregates_without_loading_details(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    write_project(tmp_path / "alpha", [
+        {"id": "auth-001", "epic": "auth", "status": "done", "created_at": "2026-01-01", "completed_at": "2026-01-03"},
+        {"id": "auth-002", "status": "done", "created_at": "2026-01-02", "completed_at": "2026-01-03"},
+    ])
+    write_project(tmp_path / "beta", [
+        {"id": "ui-001", "epic": "auth", "status": "done", "created_at": "2026-01-01", "completed_at": "2026-01-04"},
+        {"id": "ui-002", "epic": "ui", "status": "pending"},
+    ])
+    pv.scan_projects(str(tmp_path))
+    portfolio = pv.scan_projects(str(tmp_path))
+    assert portfolio.reused == 2
+
+    def no_parse(path):
+        raise AssertionError(f"parsed {path}")
+    monkeypatch.setattr(pv.Model, "load", staticmethod(no_parse))
+    data = pv.ActivityData.from_portfolio(portfolio)
+
+    assert data.completions == {"2026-01-03": 2, "2026-01-04": 1}
+    assert data.epic_completions == {"auth": {"2026-01-03": 1, "2026-01-04": 1}, "(no epic)": {"2026-01-03": 1}}
+    assert sorted(data.features_with_dates) == [
+        ("auth-001", "2026-01-01", "2026-01-03"),
+        ("auth-002", "2026-01-02", "2026-01-03"),
+        ("ui-001", "2026-01-01", "2026-01-04"),
+    ]
+    assert data.avg_cycle_time == (2 + 1 + 3) / 3
+
+
+def test_day_series_streaks_windows_and_heatmap_scrolling():
+    today = pv.date.today()
+
+    def day(n: int) -> str:
+        return (today - pv.timedelta(days=n)).isoformat()
+
+    completions = {day(0): 1, day(1): 2, day(5): 1, day(6): 1, day(7): 4, day(800): 3}
+    series = pv.DaySeries(completions)
+    stats = pv.compute_activity_stats(completions, [], series=series)
+
+    assert (stats["current_streak"], stats["longest_streak"], stats["total_days"]) == (2, 3, 801)
+    assert series.total(today - pv.timedelta(days=7), today) == 9
+    assert series.active_days(today - pv.timedelta(days=30), today) == 5
+    assert series.busiest(today - pv.timedelta(days=30), today) == (today - pv.timedelta(days=7), 4)
+    assert series.level(today.toordinal() - 7) == 4 and series.level(today.toordinal() - 2) == 0
+
+    # Scrolling is clamped so the oldest completion stays on screen.
+    max_back = pv.heatmap_max_offset(series, 120)
+    assert max_back > 52
+    def grid(weeks_back: int) -> str:
+        return "".join(map(str, pv.render_heatmap(series, 120, weeks_back)[2:9]))
+
+    assert pv.HEAT_CHARS[3] in grid(max_back)  # day 800: 3 of a 4-completion peak
+    assert pv.HEAT_CHARS[3] not in grid(0)
+
+
+def test_activity_stats_rollups_and_epic_bars_read_one_series(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    features = [{"id": f"e{n}-001", "epic": f"e{n}", "status": "done", "completed_at": "2026-03-02"} for n in range(6)]
+    features += [
+        {"id": "e0-002", "epic": "e0", "status": "done", "completed_at": "2026-03-08"},
+        {"id": "e0-003", "epic": "e0", "status": "done", "completed_at": "2026-04-01"},
+        {"id": "e0-004", "epic": "e0", "status": "done", "completed_at": "soon"},
+    ]
+    write_project(tmp_path / "alpha", features)
+
+    data = pv.ActivityData.from_portfolio(pv.scan_projects(str(tmp_path)))
+
+    # "soon" is no completion day anywhere: not in the totals, the series or the epic ranking.
+    assert data.total_done == data.series.prefix[-1] == 8
+    assert data.active_days == 3 and data.most_active_day == "2026-03-02"
+    assert data.ranked_epics[0] == ("e0", 3) and data.ranked_epics[-1] == ("other", 2)
+    assert data.best_week == (pv.date(2026, 3, 2), 7) and data.best_month == (pv.date(2026, 3, 1), 7)
+    weeks = data.series.rollup("week")
+    assert weeks[:2] == [(pv.date(2026, 3, 2), 7), (pv.date(2026, 3, 9), 0)]
+    assert sum(n for _, n in weeks) == sum(n for _, n in data.series.rollup("month")) == 8
+    assert [series.count(pv.date(2026, 3, 2)) for series in data.epic_series] == [1, 1, 1, 1, 2]
+
+
+def test_status_history_is_read_from_the_common_git_dir_of_a_worktree(tmp_path: Path):
+    main_git = tmp_path / "main" / ".git"
+    (main_git / "worktrees" / "wt").mkdir(parents=True)
+    (main_git / "worktrees" / "wt" / "commondir").write_text("../..\n")
+    worktree = tmp_path / "wt"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {main_git / 'worktrees' / 'wt'}\n")
+    features_path = write_project(worktree / "services" / "api", [{"id": "auth-001", "status": "done"}])
+    transition = {"id": "auth-001", "from": "pending", "to": "done", "timestamp": "2026-01-11T12:00:00+00:00"}
+    (main_git / pv.HISTORY_CACHE_FILE).write_text(json.dumps({
+        "version": 2, "files": {"services/api/agent-work/features.yaml": {"transitions": [transition]}},
+    }))
+
+    project = pv.ProjectSummary.from_path(str(features_path))
+
+    assert pv.load_status_history(project) == [transition]
@@ -2,9 +2,14 @@
 
 import importlib.machinery
 import importlib.util
+import io
 import json
+import os
+import signal
 import subprocess
 import sys
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -36,8 +41,7 @@ def write_features(tmp_path: Path, features: list[dict]) -> pv.ProjectSummary:
 
 def test_op_create_feature_creates_feature_with_next_id():
     model = make_model()
-    model.features["auth-001"] = pv.Feature(id="auth-001", epic="auth", status="done", title="Existing")
-    model.epics["auth"] = pv.Epic(name="auth", features=[model.features["auth-001"]])
+    model.add_feature(pv.Feature(id="auth-001", epic="auth", status="done", title="Existing"))
 
     feature = pv.op_create_feature(
         model,
@@ -139,7 +143,8 @@ def test_project_summary_keeps_project_root_for_agent_work_backlog(tmp_path: Pat
     assert project.features_path == str(tmp_path / "agent-work" / "features.yaml")
 
 
-def test_scan_projects_discovers_only_agent_work_backlogs(tmp_path: Path):
+def test_scan_projects_discovers_only_agent_work_backlogs(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
     canonical = tmp_path / "canonical"
     write_features(canonical, [{"id": "auth-001", "epic": "auth", "status": "pending"}])
 
@@ -155,6 +160,7 @@ def test_scan_projects_discovers_only_agent_work_backlogs(tmp_path: Path):
 
 
 def test_scan_projects_relative_root_keeps_project_name(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
     write_features(tmp_path, [{"id": "auth-001", "epic": "auth", "status": "pending"}])
     monkeypatch.chdir(tmp_path)
 
@@ -237,3 +243,623 @@ def test_preview_helpers_match_creation_shape():
     assert feature["priority"] == 2
     assert feature["status"] == "pending"
     assert epic == {"name": "payments", "features": []}
+
+
+def test_scan_projects_reuses_cached_summaries_until_backlog_changes(tmp_path: Path):
+    cache_path = str(tmp_path / "cache" / "scan.json")
+    root = tmp_path / "code"
+    write_features(root / "alpha", [{"id": "auth-001", "epic": "auth", "status": "pending", "created_at": "2026-01-02"}])
+    write_features(root / "beta", [{"id": "ui-001", "epic": "ui", "status": "done"}])
+
+    first = pv.scan_projects(str(root), cache_path=cache_path)
+    assert (first.parsed, first.reused) == (2, 0)
+
+    (root / "beta" / ".archived").touch()
+    second = pv.scan_projects(str(root), cache_path=cache_path)
+    assert (second.parsed, second.reused) == (0, 2)
+    alpha = next(p for p in second.projects if p.name == "alpha")
+    assert (alpha.pending, alpha.open_epics, alpha.oldest_pending_date) == (1, {"auth"}, "2026-01-02")
+    assert next(p for p in second.projects if p.name == "beta").archived
+
+    write_features(root / "alpha", [
+        {"id": "auth-001", "epic": "auth", "status": "done"},
+        {"id": "auth-002", "epic": "auth", "status": "pending"},
+    ])
+    third = pv.scan_projects(str(root), cache_path=cache_path)
+    assert (third.parsed, third.reused) == (1, 1)
+    assert next(p for p in third.projects if p.name == "alpha").total == 2
+
+    other = tmp_path / "scratch"
+    write_features(other / "tmp", [{"id": "x-001", "status": "pending"}])
+    pv.scan_projects(str(other), cache_path=cache_path)
+    (other / "tmp" / "agent-work" / "features.yaml").unlink()
+    write_features(root / "gamma", [{"id": "x-001", "status": "pending"}])
+    pv.scan_projects(str(root), cache_path=cache_path)  # another root's deleted backlog is dropped too
+    assert sorted(Path(p).parent.parent.name for p in pv.ScanCache.load(cache_path).entries) == ["alpha", "beta", "gamma"]
+
+
+def test_scan_projects_pool_matches_serial_scan_in_path_order(tmp_path: Path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pv", pv)  # other test files load their own copy under this name
+    root = tmp_path / "code"
+    for n in reversed(range(pv.PARALLEL_SCAN_MIN + 2)):
+        write_features(root / f"p{n:02d}", [{"id": f"e-{i:03d}", "epic": "e", "status": "pending"} for i in range(n + 1)])
+
+    serial = pv.scan_projects(str(root), cache_path=str(tmp_path / "serial.json"), workers=1)
+    pooled = pv.scan_projects(str(root), cache_path=str(tmp_path / "pooled.json"), workers=2)
+
+    assert [(p.name, p.total) for p in pooled.projects] == [(p.name, p.total) for p in serial.projects]
+    assert [p.name for p in serial.projects] == sorted(p.name for p in serial.projects)
+    assert pooled.parsed == pv.PARALLEL_SCAN_MIN + 2
+
+    release = threading.Event()
+    other = threading.Thread(target=release.wait)
+    other.start()
+    try:
+        assert pv.scan_pool_context() is None  # never fork beside another thread
+    finally:
+        release.set()
+        other.join()
+
+
+def test_background_scan_paints_first_and_streams_projects_in_order(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    root = tmp_path / "code"
+    for name in ("gamma", "alpha", "beta"):
+        write_features(root / name, [{"id": "auth-001", "epic": "auth", "status": "pending"}])
+
+    state = pv.init_portfolio_state(str(root), background=True)
+    assert "scanning" in pv.render(state, 100, 30)
+
+    deadline = time.monotonic() + 10
+    while state.scan and time.monotonic() < deadline:
+        pv.pump_scan(state)
+        time.sleep(0.01)
+
+    assert state.scan is None
+    assert [p.name for p in state.portfolio.projects] == ["alpha", "beta", "gamma"]
+    assert "scanning" not in pv.render(state, 100, 30)
+
+
+def test_background_scan_failure_keeps_progress_and_shows_the_error(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    root = tmp_path / "code"
+    for name in ("alpha", "beta"):
+        write_features(root / name, [{"id": "auth-001", "epic": "auth", "status": "pending"}])
+    real_iter_scan = pv.iter_scan
+
+    def failing_scan(*args, **kwargs):
+        for item in real_iter_scan(*args, **kwargs):
+            if item[0] and item[0].name == "beta":
+                raise OSError("disk went away")
+            yield item
+    monkeypatch.setattr(pv, "iter_scan", failing_scan)
+
+    state = pv.init_portfolio_state(str(root), background=True)
+    deadline = time.monotonic() + 10
+    while state.scan and time.monotonic() < deadline:
+        pv.pump_scan(state)
+        time.sleep(0.01)
+
+    assert [p.name for p in state.portfolio.projects] == ["alpha"]
+    assert state.portfolio.parsed == 2 and state.portfolio.dirs > 0  # counts reached, not zeroed
+    assert "scan stopped early: OSError: disk went away" in pv.render(state, 120, 30)
+
+
+def test_discovery_prunes_ignored_deep_and_nested_repo_dirs(tmp_path: Path):
+    code = tmp_path / "code"
+    write_features(code / "repo", [{"id": "auth-001", "status": "pending"}])
+    (code / "repo" / ".git").mkdir()
+    write_features(code / "repo" / "packages" / "inner", [{"id": "ui-001", "status": "pending"}])
+    write_features(code / "plain" / "nested", [{"id": "ui-001", "status": "pending"}])
+    write_features(code / "scratch" / "tmp-data", [{"id": "x-001", "status": "pending"}])
+    write_features(code / "vendor" / "lib", [{"id": "x-001", "status": "pending"}])
+    write_features(code / "a" / "b" / "c", [{"id": "x-001", "status": "pending"}])
+    (code / ".gitignore").write_text("# generated\ntmp-*/\n")
+    (code / "scratch" / ".pvignore").write_text("/missing\n")
+    other = tmp_path / "other"
+    write_features(other / "side", [{"id": "ops-001", "status": "pending"}])
+
+    progress = pv.ScanProgress()
+    found = sorted(pv.iter_backlogs([str(code), str(other)], 2, progress))
+
+    assert found == [
+        str(code / "plain" / "nested" / "agent-work" / "features.yaml"),
+        str(code / "repo" / "agent-work" / "features.yaml"),
+        str(other / "side" / "agent-work" / "features.yaml"),
+    ]
+    assert progress.dirs > 0
+    assert progress.discovery_seconds > 0
+
+
+def test_ignore_rules_match_double_star_per_component_and_dir_only_on_dirs(tmp_path: Path):
+    code = tmp_path / "code"
+    code.mkdir()
+    (code / ".gitignore").write_text("**/cache\nsrc/**/gen\nlogs/\nbuild/**\n")
+    rules = pv.read_ignore_rules(str(code))
+
+    def ignored(rel: str, is_dir: bool = True) -> bool:
+        return pv.is_ignored(rules, str(code / rel), is_dir)
+
+    # '**/cache' is cache at any depth, not every name ending in "cache".
+    assert ignored("cache") and ignored("a/b/cache")
+    assert not ignored("mycache") and not ignored("a/pagecache")
+    # A '**' between components spans zero or more of them.
+    assert ignored("src/gen") and ignored("src/a/b/gen")
+    assert not ignored("src/generated") and not ignored("lib/gen")
+    # 'logs/' only matches a directory.
+    assert ignored("logs") and not ignored("logs", is_dir=False)
+    # 'build/**' is everything inside build, not build itself.
+    assert ignored("build/out") and not ignored("build")
+
+
+def test_watchers_report_only_changed_backlogs_and_archive_markers(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    root = tmp_path / "code"
+    write_features(root / "alpha", [{"id": "auth-001", "epic": "auth", "status": "pending"}])
+    write_features(root / "beta", [{"id": "ui-001", "epic": "ui", "status": "pending"}])
+    state = pv.init_portfolio_state(str(root))
+
+    watchers = [pv.PollingWatcher(interval=0)]
+    try:
+        watchers.append(pv.InotifyWatcher())
+    except (OSError, AttributeError):
+        pass  # polling still covers the behaviour off Linux
+    for watcher in watchers:
+        watcher.sync(state.portfolio.projects)
+        watcher.changes()
+
+    time.sleep(0.01)  # distinct mtime_ns for the polling watcher
+    write_features(root / "alpha", [
+        {"id": "auth-001", "epic": "auth", "status": "done"},
+        {"id": "auth-002", "epic": "auth", "status": "pending"},
+    ])
+    (root / "beta" / ".archived").touch()
+    for watcher in watchers:
+        assert watcher.changes() == {str(root / "alpha"), str(root / "beta")}
+        assert watcher.changes() == set()
+        watcher.close()
+
+    alpha = state.portfolio.projects[0]
+    assert pv.apply_external_changes(state, {str(root / "alpha"), str(root / "beta")})
+    assert (alpha.total, alpha.done) == (2, 1)
+    assert state.portfolio.projects[1].archived
+    assert "beta" not in pv.render(state, 100, 30)
+
+
+def test_external_change_to_dirty_project_flags_conflict_instead_of_reloading(tmp_path: Path):
+    project = write_features(tmp_path, [{"id": "auth-001", "epic": "auth", "status": "pending", "title": "Local"}])
+    state = pv.init_project_state(project.features_path)
+    detail = state.current_project.load_detail()
+    state.view, state.current_feature, state.dirty = "feature", "auth-001", True
+
+    write_features(tmp_path, [{"id": "auth-001", "epic": "auth", "status": "done", "title": "Remote"}])
+    assert pv.apply_external_changes(state, {state.current_project.path})
+
+    assert state.conflict
+    assert state.current_project.load_detail() is detail
+    assert detail.features["auth-001"].title == "Local"
+    assert "changed on disk" in pv.render(state, 120, 30)
+
+
+def test_tree_flat_index_is_patched_on_expand_and_collapse(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    root = tmp_path / "code"
+    for name in ("alpha", "beta"):
+        write_features(root / name, [
+            {"id": "auth-001", "epic": "auth", "status": "pending", "title": "Login"},
+            {"id": "auth-002", "epic": "auth", "status": "pending", "title": "Logout"},
+            {"id": "ui-001", "epic": "ui", "status": "pending", "title": "Shell"},
+        ])
+    state = pv.init_portfolio_state(str(root))
+    pv.handle_input("t", state)
+    tree = state.tree
+
+    def fresh() -> list:
+        return [(depth, node.id) for depth, node in pv.flatten_tree(tree.root, zoomed=tree.zoomed_node)]
+
+    flat = tree.flat
+    assert tree.counts == {"project": 2, "epic": 4}
+    tree.cursor_idx = 1
+    pv.handle_input("right", state)
+    assert tree.flat is flat
+    assert [(d, n.id) for d, n in tree.flat] == fresh()
+    assert tree.counts == {"project": 2, "epic": 4, "feature": 2}
+
+    pv.handle_input("left", state)
+    assert [(d, n.id) for d, n in tree.flat] == fresh()
+    assert tree.counts == {"project": 2, "epic": 4, "feature": 0}
+
+    pv.handle_input("/", state)
+    for key in "logout":
+        pv.handle_input(key, state)
+    pv.handle_input("\r", state)
+    assert [(d, n.id) for d, n in tree.flat] == fresh()
+    assert tree.flat[tree.cursor_idx][1].id == "auth-002"
+    assert tree.search_match_set == set(tree.search_matches) and len(tree.search_matches) == 2
+
+
+def test_tree_search_indexes_unexpanded_epics_and_narrows_as_you_type(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    root = tmp_path / "code"
+    write_features(root / "alpha", [
+        {"id": "auth-001", "epic": "auth", "status": "pending", "title": "Login", "description": "OAuth callback"},
+        {"id": "auth-002", "epic": "auth", "status": "done", "title": "Logout"},
+    ])
+    beta = root / "beta"
+    write_features(beta, [{"id": "ui-001", "epic": "ui", "status": "pending", "title": "Callback page"}])
+    state = pv.init_portfolio_state(str(root))
+    pv.handle_input("t", state)
+    tree = state.tree
+    pv.handle_input("/", state)
+
+    for key in "call":
+        pv.handle_input(key, state)
+    assert [n.id for n in tree.search_matches] == ["auth-001", "ui-001"]
+    assert tree.search_hits[-1] == state.search_index.search("call", tree.search_hits[-2])
+    pv.handle_input("b", state)
+    assert [n.id for n in tree.search_matches] == ["auth-001", "ui-001"]
+    pv.handle_input("x", state)
+    assert tree.search_matches == []
+    pv.handle_input("\x7f", state)
+    assert len(tree.search_matches) == 2
+
+    pv.handle_input("\x1b", state)
+    time.sleep(0.01)
+    write_features(beta, [{"id": "ui-001", "epic": "ui", "status": "pending", "title": "Settings"}])
+    pv.apply_external_changes(state, {str(beta)})
+    indexed = state.search_index.blocks[str(root / "alpha")]
+    pv.handle_input("/", state)
+    assert state.search_index.blocks[str(root / "alpha")] is indexed
+    for key in "settings":
+        pv.handle_input(key, state)
+    pv.handle_input("\r", state)
+    assert tree.flat[tree.cursor_idx][1].id == "ui-001"
+
+
+def test_search_index_parses_backlogs_without_filling_the_detail_cache(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    for name in ("alpha", "beta", "gamma"):
+        write_features(tmp_path / "code" / name, [{"id": "a-001", "epic": "a", "status": "pending", "title": name}])
+    state = pv.init_portfolio_state(str(tmp_path / "code"))
+    projects = state.portfolio.projects
+    for proj in projects:
+        proj._detail = None
+    state.portfolio.details.sizes.clear()
+
+    index = pv.SearchIndex()
+    index.sync(projects)
+    assert all(proj._detail is None for proj in projects)
+    assert not state.portfolio.details.sizes
+    assert [index.blocks[path].rows[row] for path, row in index.search("gamma")] == [
+        ("project", None, None), ("feature", "a", "a-001")]
+
+
+def test_portfolio_preview_and_reload_use_one_parse(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    root = tmp_path / "code"
+    write_features(root / "alpha", [
+        {"id": "auth-001", "epic": "auth", "status": "pending", "title": "Later", "priority": 3},
+        {"id": "auth-002", "epic": "auth", "status": "pending", "title": "Sooner", "priority": "high"},
+        {"id": "auth-003", "epic": "auth", "status": "done"},
+    ])
+    pv.scan_projects(str(root))
+    state = pv.init_portfolio_state(str(root))
+    project = state.portfolio.projects[0]
+    assert state.portfolio.reused == 1
+    assert project.up_next == ("auth-002", "pending", "Sooner")
+    assert "auth-002" in pv.render(state, 100, 30)
+    assert project._detail is None
+
+    loads = []
+    real_yaml_load = pv.yaml.load
+    monkeypatch.setattr(pv.yaml, "load", lambda *a, **k: loads.append(1) or real_yaml_load(*a, **k))
+    project.load_detail()
+    write_features(root / "alpha", [{"id": "auth-004", "epic": "auth", "status": "in_progress", "title": "Now"}])
+    loads.clear()
+    assert project.reload()
+    assert len(loads) == 1
+    assert project.up_next == ("auth-004", "in_progress", "Now")
+    assert list(project._detail.features) == ["auth-004"]
+
+    project._detail.features["auth-004"].title = "Renamed"
+    loads.clear()
+    assert pv.save_features(project)
+    assert loads == [] and project.up_next == ("auth-004", "in_progress", "Renamed")
+
+
+def test_screen_repaints_only_changed_rows_and_clears_on_resize():
+    out = io.StringIO()
+    screen = pv.Screen(out)
+    first = ["┌──┐", "│ab│", "└──┘"]
+
+    screen.paint(first, 4, 10)
+    assert out.getvalue().startswith("\033[2J")
+    assert screen.paint(first, 4, 10) == 0
+
+    out.truncate(0), out.seek(0)
+    assert screen.paint(["┌──┐", "│ac│", "└──┘"], 4, 10) == len("\033[2;1H│ac│".encode())
+    assert out.getvalue() == "\033[2;1H│ac│"
+
+    out.truncate(0), out.seek(0)
+    screen.paint(["┌──┐", "└──┘"], 4, 10)
+    assert out.getvalue() == "\033[2;1H└──┘\033[3;1H\033[J"
+
+    out.truncate(0), out.seek(0)
+    screen.paint(["┌──┐", "└──┘"], 6, 1)
+    assert out.getvalue() == "\033[2J\033[1;1H┌──┐\033[K"
+    assert screen.frames == 5 and screen.total_bytes > 0
+
+
+def test_key_reader_decodes_sequences_and_coalesces_auto_repeat(tmp_path: Path, monkeypatch):
+    read_fd, write_fd = os.pipe()
+    reader = pv.KeyReader(read_fd)
+    os.write(write_fd, b"jjj\x1b[5~\x1b[1;5A\x1bOH\x1b[<0;3;4M\xc3\xa9\x1bx")
+    assert reader.read(0) == ["j", "j", "j", "pgup", "ctrl+up", "home", "é", "alt+x"]
+
+    os.write(write_fd, b"\x1b[")  # split across reads: finished within ESC_TIMEOUT
+    os.write(write_fd, b"B\x1b")
+    assert reader.read(0) == ["down", "\x1b"]
+    assert reader.read(0) == []
+    os.write(write_fd, b"\x1b")  # Esc, then q a moment later: not alt+q
+    threading.Timer(pv.ESC_TIMEOUT / 5, os.write, (write_fd, b"q")).start()
+    assert reader.read(0) == ["\x1b", "q"]
+    os.close(write_fd)
+    assert reader.read(0) == ["q"]
+    os.close(read_fd)
+
+    assert pv.coalesce_keys(["j", "j", "j", "x", "x", "k"]) == [("j", 3), ("x", 1), ("x", 1), ("k", 1)]
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    for n in range(15):
+        write_features(tmp_path / "code" / f"p{n:02d}", [{"id": "a-001", "status": "pending"}])
+    state = pv.init_portfolio_state(str(tmp_path / "code"))
+    pv.handle_input("j", state, repeat=4)
+    assert state.project_index == 4
+    pv.handle_input("end", state)
+    assert state.project_index == 14
+    pv.handle_input("pgup", state)
+    assert state.project_index == 4
+    pv.handle_input("t", state)
+    pv.handle_input("/", state)
+    pv.handle_input("j", state, repeat=2)
+    assert state.tree.search_query == "jj"
+
+
+def test_event_loop_wakes_on_resize_and_threads_and_caps_frame_rate():
+    read_fd, write_fd = os.pipe()
+    reader = pv.KeyReader(read_fd)
+    with pv.EventLoop(reader, pv.PollingWatcher(interval=5), frame_interval=0.2) as loop:
+        assert loop.take_frame()
+        loop.dirty = True
+        assert not loop.take_frame()  # inside the frame interval: deferred, not dropped
+        started = time.monotonic()
+        assert loop.wait() == []
+        assert 0.1 < time.monotonic() - started < 1
+        assert loop.take_frame()
+
+        os.kill(os.getpid(), signal.SIGWINCH)
+        started = time.monotonic()
+        assert loop.wait() == []
+        assert time.monotonic() - started < 1 and loop.dirty
+
+        loop.dirty = False
+        threading.Timer(0.05, loop.wake).start()
+        started = time.monotonic()
+        assert loop.wait() == [] and not loop.dirty
+        assert time.monotonic() - started < 1
+
+        os.write(write_fd, b"jk")
+        assert loop.wait() == ["j", "k"]
+    assert signal.getsignal(signal.SIGWINCH) == signal.SIG_DFL
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def test_styled_lines_measure_wide_characters_and_frame_to_exact_width():
+    assert pv.display_width("任务 ok") == 7
+    assert pv.display_width("🚀é") == 3
+    assert pv.truncate("日本語のタイトル", 7) == "日本語…"
+    assert pv.fit("日本", 6) == "日本  "
+
+    line = pv.Line("  ", pv.Line.styled("名前", "1"), " → ", pv.Line.styled("done", "38;5;34"))
+    assert line.width == 13 and line.plain == "  名前 → done"
+    assert line.ansi_text() == "  \033[1m名前\033[0m → \033[38;5;34mdone\033[0m"
+    assert line.truncate(6).plain == "  名…" and line.truncate(6).width == 5
+
+    rows = pv.frame(["plain", line, pv.Line("x" * 40)], 20, title="タイトル", footer="[q]uit")
+    assert {row.width for row in rows} == {20}
+    assert pv.visible_len(rows[3].ansi_text()) == 20
+
+
+def test_derived_data_and_rows_are_memoized_per_revision(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    for n in range(6):
+        write_features(tmp_path / "code" / f"p{n}", [
+            {"id": "a-001", "epic": "a", "status": "pending"},
+            {"id": "a-002", "epic": "a", "status": "done", "depends_on": ["a-001"]},
+        ])
+    state = pv.init_portfolio_state(str(tmp_path / "code"))
+    portfolio = state.portfolio
+    display = portfolio.display(state.sort_mode, state.filter_mode)
+    assert portfolio.display(state.sort_mode, state.filter_mode) is display
+    assert portfolio.total_done == 6
+
+    built = []
+    real_row = pv.render_project_row
+    monkeypatch.setattr(pv, "render_project_row", lambda *a: built.append(a[0].name) or real_row(*a))
+    frame = pv.render_lines(state, 100, 30)
+    assert len(built) == 6 and pv.render_lines(state, 100, 30) is frame
+    built.clear()
+    pv.handle_input("j", state)
+    pv.render_lines(state, 100, 30)
+    assert sorted(built) == sorted([display[0].name, display[1].name])  # only the cursor rows
+
+    # Mutations bump the revision and drop memoized counts.
+    model = display[0].load_detail()
+    assert model.done == 1 and model.unlocks("a-001") == ["a-002"]
+    revision = model.revision
+    pv.op_create_feature(model, "a", {"status": "in_progress", "depends_on": ["a-001"]})
+    assert model.revision == revision + 1
+    assert model.active == 1 and model.unlocks("a-001") == ["a-002", "a-003"]
+
+    display[0].archived = True
+    pv.project_changed(state, display[0])
+    assert len(portfolio.display(state.sort_mode, state.filter_mode)) == 5
+    assert portfolio.archived_projects == 1
+    portfolio.verify()
+
+    assert portfolio.stalled_projects == 0
+    display[1].last_modified -= pv.timedelta(days=pv.STALL_DAYS)  # time passes, nothing is edited
+    portfolio.verify()  # stalled is derived, not a maintained counter that could drift
+    portfolio.touch()
+    assert portfolio.stalled_projects == 1
+
+
+def test_detail_models_are_evicted_lru_but_open_and_unsaved_ones_stay(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("PV_DETAIL_CACHE", "5")
+    for n in range(4):
+        write_features(tmp_path / "code" / f"p{n}", [
+            {"id": "a-001", "epic": "a", "status": "pending"},
+            {"id": "a-002", "epic": "a", "status": "done"},
+        ])
+    state = pv.init_portfolio_state(str(tmp_path / "code"))
+    p0, p1, p2, p3 = state.portfolio.projects
+
+    state.view, state.current_project = "project", p0
+    p0.load_detail().update_feature(p0._detail.features["a-001"], {"status": "in_progress"})
+    state.dirty = True
+    p1.load_detail()
+    p2.load_detail()
+    assert p0._detail is not None and p1._detail is None  # p0 is open and dirty, p1 was oldest
+    assert state.portfolio.details.features <= 5
+
+    pv.handle_input("\x1b", state)  # back out of the project with the edit still unsaved
+    assert state.current_project is None and state.dirty
+    p3.load_detail()
+    assert p0._detail is not None and p2._detail is None  # dirty p0 stays pinned
+    assert p1.load_detail().features["a-001"].status == "pending"  # re-read from disk
+
+    state.current_project = p0
+    assert pv.save_dirty(state) and not state.dirty
+    state.current_project = None
+    p2.load_detail()
+    assert p0._detail is None  # saved and closed, so evictable
+    assert p0.load_detail().features["a-001"].status == "in_progress"
+
+
+def test_prefetch_parses_around_the_cursor_and_drops_superseded_jobs(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    for n in range(8):
+        write_features(tmp_path / "code" / f"p{n}", [{"id": "a-001", "epic": "a", "status": "pending"}])
+    state = pv.init_portfolio_state(str(tmp_path / "code"))
+    state.sort_mode = "name"
+    display = state.portfolio.display(state.sort_mode, state.filter_mode)
+    state.project_index = 3
+    targets = pv.prefetch_targets(state)
+    assert [p.name for p in targets] == ["p3", "p4", "p2", "p5", "p1"]
+
+    prefetch = pv.DetailPrefetcher()
+    prefetch.request(targets)
+    prefetch.step(prefetch.jobs.get_nowait())  # p3 parses before the cursor moves
+    state.project_index = 7
+    prefetch.request(pv.prefetch_targets(state))
+    worked = []
+    while not prefetch.jobs.empty():
+        worked.append(prefetch.step(prefetch.jobs.get_nowait()))
+    assert worked == [False] * 4 + [True] * 3  # p4, p2, p5, p1 were cancelled
+
+    assert prefetch.adopt(state.portfolio) and prefetch.adopted == 4
+    loaded = {p.name for p in display if p._detail is not None}
+    assert loaded == {"p3", "p7", "p6", "p5"}
+    model = display[7]._detail
+    handle = pv.handle_input("\r", state)
+    assert handle.current_project is display[7] and display[7]._detail is model  # warm hit
+
+    stale = display[0]
+    prefetch.request([stale])
+    assert prefetch.step(prefetch.jobs.get_nowait())
+    pv.rescan(state)  # `r` lands before the parsed model is adopted
+    assert not prefetch.adopt(state.portfolio)
+    assert stale._detail is None and prefetch.adopted == 4
+
+
+def test_jump_prompt_completes_ids_from_the_scan_cache_and_opens_one_project(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    for name, ids in (("api", ["auth-041", "auth-042"]), ("web", ["auth-042", "ui-001"])):
+        write_features(tmp_path / "code" / name, [{"id": fid, "epic": fid.split("-")[0], "status": "pending"} for fid in ids])
+    pv.init_portfolio_state(str(tmp_path / "code"))
+    state = pv.init_portfolio_state(str(tmp_path / "code"))
+    portfolio = state.portfolio
+    assert portfolio.reused == 2  # IDs came back from the scan cache
+    assert [(fid, p.name) for fid, p in portfolio.complete_id("AUTH-04")] == [
+        ("auth-041", "api"), ("auth-042", "api"), ("auth-042", "web")]
+
+    loads = []
+    real_load = pv.Model.load
+    monkeypatch.setattr(pv.Model, "load", lambda path: loads.append(path) or real_load(path))
+    for key in ["g", "a", "u", "t", "h", "-", "0", "4", "2", "down", "\r"]:
+        state = pv.handle_input(key, state)
+    assert state.jump is None and state.view == "feature"
+    assert (state.current_project.name, state.current_feature, state.current_epic) == ("web", "auth-042", "auth")
+    assert len(loads) == 1 and "web" in loads[0]
+
+    pv.handle_input(":", state)
+    pv.handle_input("u", state)
+    pv.handle_input("\t", state)
+    assert state.jump.query == "ui-001"
+    assert "ui-001" in pv.render(state, 80, 24)
+    pv.handle_input("\x1b", state)
+    assert state.jump is None and state.view == "feature"
+
+    for key in (":", "down", "\r"):  # an empty prompt just closes
+        pv.handle_input(key, state)
+    assert state.jump is None and state.current_feature == "auth-042" and not state.flash_message
+    portfolio.verify()
+
+
+def test_tree_nodes_look_up_evicted_models_instead_of_holding_them(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("PV_DETAIL_CACHE", "2")
+    for name in ("alpha", "beta", "gamma"):
+        write_features(tmp_path / "code" / name, [
+            {"id": "auth-001", "epic": "auth", "status": "pending", "title": "Login"},
+            {"id": "auth-002", "epic": "auth", "status": "pending", "title": "Logout"},
+        ])
+    state = pv.init_portfolio_state(str(tmp_path / "code"))
+    pv.handle_input("t", state)
+    pv.expand_all(state.tree.root)
+    state.tree.invalidate()
+    alpha = state.portfolio.projects[0]
+    assert alpha._detail is None  # expanding gamma evicted it
+    assert all(node.data is None for _, node in state.tree.flat if node.type != "project")
+    loads = []
+    real_load = pv.Model.load
+    monkeypatch.setattr(pv.Model, "load", lambda path: loads.append(path) or real_load(path))
+    rows = [pv.render_tree_node(depth, node, False, 80).plain.strip() for depth, node in state.tree.flat]
+    assert not loads and "· auth-001" in rows  # drawing never re-reads an evicted model
+
+    state.tree.cursor_idx = next(i for i, (_, n) in enumerate(state.tree.flat) if n.id == "auth-001")
+    pv.handle_input("\r", state)
+    assert state.current_project is alpha and state.view == "feature"
+    alpha._detail.update_feature(alpha._detail.features["auth-001"], {"status": "done"})
+    pv.handle_input("\x1b", state)
+    row = pv.render_tree_node(2, state.tree.flat[state.tree.cursor_idx][1], True, 80)
+    assert row.plain.strip(" ▸") == "✓ auth-001 Login"
+
+
+def test_backlog_items_without_an_id_are_skipped_not_fatal_to_the_scan(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    write_features(tmp_path / "code" / "good", [{"id": "a-001", "status": "pending"}])
+    write_features(tmp_path / "code" / "odd", [
+        {"status": "pending", "title": "No id"},
+        "stray scalar",
+        {"id": "b-001", "status": "done"},
+    ])
+
+    portfolio = pv.scan_projects(str(tmp_path / "code"))
+
+    odd = next(p for p in portfolio.projects if p.name == "odd")
+    assert [p.name for p in portfolio.projects] == ["good", "odd"]
+    assert (odd.total, odd.done, odd.ids) == (1, 1, ["b-001"])
+    assert list(odd.load_detail().features) == ["b-001"]
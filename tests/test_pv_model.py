@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+import importlib.machinery
+import importlib.util
+import sys
+from pathlib import Path
+
+pv_path = Path(__file__).parent.parent / "bin" / "pv"
+loader = importlib.machinery.SourceFileLoader("pv", str(pv_path))
+spec = importlib.util.spec_from_loader("pv", loader)
+pv = importlib.util.module_from_spec(spec)
+sys.modules[spec.name] = pv
+loader.exec_module(pv)
+
+
+def test_feature_records_are_slotted_and_share_interned_strings():
+    def fresh(*parts: str) -> str:  # built at runtime, so never a shared literal
+        return "".join(parts)
+
+    raw = [{"id": fresh("auth-00", n), "epic": fresh("au", "th"), "status": fresh("pen", "ding"),
+            "depends_on": [fresh("auth-", "001")]} for n in "23"]
+    assert raw[0]["status"] is not raw[1]["status"]
+    first, second = map(pv.Feature.from_dict, raw)
+
+    assert not hasattr(first, "__dict__")
+    assert first.status is second.status
+    assert first.epic is second.epic
+    assert first.depends_on[0] is second.depends_on[0]
+
+
+def test_mutation_api_keeps_counters_in_step_with_a_recount():
+    model = pv.Model.from_items([
+        {"id": "auth-001", "epic": "auth", "status": "done", "created_at": "2026-01-02"},
+        {"id": "auth-002", "epic": "auth", "status": "pending", "created_at": "2026-01-02"},
+        {"id": "ui-001", "epic": "ui", "status": "in_progress"},
+    ])
+    assert (model.total, model.done, model.active, model.pending) == (3, 1, 1, 1)
+    assert model.epics["auth"].percent == 50
+
+    model.update_feature(model.features["auth-002"], {"status": "in_progress", "title": "Now"})
+    assert (model.active, model.pending, model.epics["auth"].active) == (2, 0, 1)
+    model.update_feature(model.features["ui-001"], {"epic": "auth", "status": "abandoned"})
+    assert model.epics["ui"].total == 0 and model.epics["auth"].abandoned == 1
+    assert pv.op_create_feature(model, "ui", {"status": "pending"}).id == "ui-002"  # ui-001 kept its ID
+    assert model.remove_feature("auth-001").id == "auth-001"
+    assert model.activity == {"2026-01-02": ["auth-002"], model.features["ui-002"].created_at: ["ui-002"]}
+    assert (model.done, model.pending, model.epics["auth"].done) == (0, 1, 0)
+    model.verify()
+
+    model.features["auth-002"].status = "done"  # bypasses the API
+    try:
+        model.verify()
+    except AssertionError as e:
+        assert "counts" in str(e)
+    else:
+        raise AssertionError("verify() missed a drifted counter")
+
+
+def test_dependency_and_id_indexes_follow_edits():
+    model = pv.Model.from_items([
+        {"id": "api-001", "epic": "api", "status": "done", "title": "Schema"},
+        {"id": "api-002", "epic": "api", "status": "pending", "depends_on": ["api-001"]},
+        {"id": "api-007", "epic": "api", "status": "pending", "depends_on": ["api-002", "api-001"]},
+        {"id": "ui-001", "epic": "ui", "status": "pending", "depends_on": ["api-007", "api-007"]},
+    ])
+    assert model.unlocks("api-001") == ["api-002", "api-007"]
+    assert model.downstream("api-001") == ["api-002", "api-007", "ui-001"]
+    assert pv.next_feature_id(model, "api") == "api-008"
+    assert [f.id for f in model.upcoming()] == ["api-002", "api-007", "ui-001"]
+
+    model.update_feature(model.features["api-007"], {"depends_on": ["api-001"], "status": "done"})
+    assert model.unlocks("api-002") == [] and model.downstream("api-001") == ["api-002", "api-007", "ui-001"]
+    assert set(model.by_status) == {"done", "pending"} and len(model.by_status["done"]) == 2
+    model.remove_feature("api-007")
+    assert pv.next_feature_id(model, "api") == "api-003"
+    assert model.downstream("api-001") == ["api-002"]
+    model.verify()
+
+    tree = [line.plain for line in pv.dependency_tree(model, model.features["api-002"], 60)]
+    assert tree == ["  └─ ✓ api-001  Schema"]
+
+    # A chain deeper than the cap: the count covers the whole unseen subtree.
+    chain = pv.Model.from_items([{"id": f"c-{n:03d}", "epic": "c", "status": "pending",
+                                  "depends_on": [f"c-{n + 1:03d}"] if n < 20 else []} for n in range(21)])
+    tree = [line.plain for line in pv.dependency_tree(chain, chain.features["c-000"], 60)]
+    assert len(tree) == pv.DEP_TREE_MAX_ROWS + 1 and tree[-1].strip() == f"… (+{20 - pv.DEP_TREE_MAX_ROWS} more)"
+
+
+def test_duplicate_ids_keep_the_last_record_and_consistent_counters():
+    model = pv.Model.from_items([
+        {"id": "a-001", "epic": "a", "status": "done"},
+        {"id": "a-001", "epic": "b", "status": "pending", "depends_on": ["a-000"]},
+    ])
+    assert (model.total, model.done, model.pending) == (1, 0, 1)
+    assert list(model.epics) == ["b"] and model.epics["b"].total == 1
+    assert model.features["a-001"].epic == "b"
+    model.verify()